@@ -5,24 +5,29 @@ Private utilities.
 from __future__ import annotations
 
 import heapq
+import json
+import warnings
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import MISSING, dataclass, fields, is_dataclass
-from functools import total_ordering
-from typing import TYPE_CHECKING, Any, Self, TypeVar
+from functools import lru_cache, total_ordering
+from typing import TYPE_CHECKING, Any, Literal, Self, TypeVar, cast, overload
 
 import pydantic
 import pydantic_zarr.v2
 import pydantic_zarr.v3
 from pydantic import create_model
 
-from ome_zarr_models.base import BaseAttrsv2, BaseAttrsv3
+from ome_zarr_models.base import BaseAttrs, BaseAttrsv2, BaseAttrsv3
 from ome_zarr_models.common.validation import (
+    _FIXES_CONTEXT_KEY,
+    _open_group_path,
     check_array_path,
-    check_group_path,
 )
+from ome_zarr_models.exceptions import ValidationWarning
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping, Sequence
 
     import graphviz
     import zarr
@@ -38,6 +43,220 @@ if TYPE_CHECKING:
     from ome_zarr_models.v05.base import BaseGroupv05
 
 
+TAttrs = TypeVar("TAttrs", bound=BaseAttrs)
+
+
+@lru_cache(maxsize=128)
+def _validate_attrs_json(
+    attrs_cls: type[BaseAttrs], attrs_json: str
+) -> tuple[BaseAttrs, tuple[str, ...]]:
+    """
+    Validate JSON attributes, caching the result and any fixes made to them.
+
+    Fixes are collected through the validation context, rather than by
+    recording warnings, so that warnings raised at the same time by other
+    threads are never mixed up with them.
+    """
+    fixes: list[str] = []
+    attributes = attrs_cls.model_validate_json(
+        attrs_json, context={_FIXES_CONTEXT_KEY: fixes}
+    )
+    return attributes, tuple(fixes)
+
+
+def _validate_attrs(attrs_cls: type[TAttrs], attrs: Any) -> TAttrs:
+    """
+    Validate group attributes against an attributes class.
+
+    Validating OME-Zarr metadata is relatively expensive, and the same group is
+    often opened several times (e.g., in notebooks), so results are cached based on
+    the JSON representation of the attributes.
+
+    Any fixes made during validation are warned about every time; this means
+    metadata fixes are always reported to the user, and that
+    ``ome-zarr-models validate`` still errors on them.
+    """
+    attributes, fixes = _validate_attrs_json(attrs_cls, json.dumps(attrs))
+    for fix in fixes:
+        warnings.warn(fix, ValidationWarning, stacklevel=3)
+    # The models are frozen, but can hold mutable values (e.g., lists),
+    # so return a copy of the cached model to avoid sharing these
+    return cast("TAttrs", attributes.model_copy(deep=True))
+
+
+# Maximum number of array metadata fetches to run at the same time
+_MAX_FETCH_WORKERS = 16
+
+
+@overload
+def _check_array_paths(
+    group: zarr.Group,
+    array_paths: Sequence[str],
+    *,
+    expected_zarr_version: Literal[2],
+) -> list[pydantic_zarr.v2.AnyArraySpec]: ...
+
+
+@overload
+def _check_array_paths(
+    group: zarr.Group,
+    array_paths: Sequence[str],
+    *,
+    expected_zarr_version: Literal[3],
+) -> list[pydantic_zarr.v3.AnyArraySpec]: ...
+
+
+def _check_array_paths(
+    group: zarr.Group,
+    array_paths: Sequence[str],
+    *,
+    expected_zarr_version: Literal[2, 3],
+) -> list[pydantic_zarr.v2.AnyArraySpec] | list[pydantic_zarr.v3.AnyArraySpec]:
+    """
+    Check that arrays exist at several paths in a group.
+
+    The metadata for each array is fetched concurrently, which is much faster
+    than fetching them one after another on remote stores.
+
+    Returns
+    -------
+    list[ArraySpec]
+        The ArraySpec of each array, in the same order as `array_paths`.
+
+    Raises
+    ------
+    ValueError
+        If any of the arrays don't exist, or aren't the expected Zarr version.
+        If several arrays are invalid, the error for the first one is raised.
+    """
+
+    def check(array_path: str) -> Any:
+        return check_array_path(
+            group, array_path, expected_zarr_version=expected_zarr_version
+        )
+
+    if len(array_paths) <= 1 or group.metadata.consolidated_metadata is not None:
+        # No store access needed, so nothing to gain from using threads
+        return [check(array_path) for array_path in array_paths]
+
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_FETCH_WORKERS, len(array_paths))
+    ) as executor:
+        # map() returns results in order, so iterating over it raises
+        # the error from the first invalid path
+        return list(executor.map(check, array_paths))
+
+
+def _members_from_flat(
+    members_flat: Mapping[str, Any],
+    group_spec_cls: type[pydantic_zarr.v2.AnyGroupSpec]
+    | type[pydantic_zarr.v3.AnyGroupSpec],
+) -> dict[str, Any]:
+    """
+    Create the members of a group from a flat hierarchy of already validated nodes.
+
+    This gives the same result as `group_spec_cls.from_flat(members_flat).members`,
+    but skips dumping and re-validating the whole hierarchy. Groups are rebuilt as
+    plain `group_spec_cls` instances, and arrays are re-used as they are.
+
+    Parameters
+    ----------
+    members_flat :
+        Mapping from paths (relative to the parent group) to array and group specs.
+        Paths must start with a "/".
+    group_spec_cls :
+        GroupSpec class to create groups with.
+
+    Raises
+    ------
+    ValueError
+        If a node is not an ArraySpec or GroupSpec.
+    """
+    array_spec_cls = (
+        pydantic_zarr.v2.ArraySpec
+        if issubclass(group_spec_cls, pydantic_zarr.v2.GroupSpec)
+        else pydantic_zarr.v3.ArraySpec
+    )
+    arrays: dict[str, Any] = {}
+    groups: dict[str, Any] = {}
+    sub_members_flat: dict[str, dict[str, Any]] = {}
+    for path, node in members_flat.items():
+        name, _, sub_path = path.removeprefix("/").partition("/")
+        if sub_path:
+            sub_members_flat.setdefault(name, {})["/" + sub_path] = node
+        elif isinstance(node, group_spec_cls):
+            groups[name] = node
+            sub_members_flat.setdefault(name, {})
+        elif isinstance(node, array_spec_cls):
+            arrays[name] = node
+        else:
+            raise ValueError(
+                f"Value at '{path}' is not an ArraySpec or GroupSpec "
+                f"(got {type(node)=})"
+            )
+
+    members: dict[str, Any] = {}
+    for name, sub_members in sub_members_flat.items():
+        # Groups without a node of their own are implicit groups with no attributes
+        fields = (
+            groups[name].model_dump(exclude={"members"})
+            if name in groups
+            else {"attributes": {}}
+        )
+        members[name] = group_spec_cls.model_construct(
+            **fields, members=_members_from_flat(sub_members, group_spec_cls)
+        )
+    # Same order as from_flat(): groups first, then arrays
+    return {**members, **arrays}
+
+
+def _get_member(
+    group: pydantic_zarr.v2.GroupSpec[Any, Any] | pydantic_zarr.v3.GroupSpec[Any, Any],
+    path: str,
+) -> Any | None:
+    """
+    Get the node at a path relative to a group, or `None` if there isn't one.
+
+    This gives the same result as `group.to_flat().get("/" + path)`, but only
+    walks the groups along the path instead of copying the whole hierarchy.
+    """
+    node: Any = group
+    for name in path.split("/"):
+        if (
+            not isinstance(
+                node, pydantic_zarr.v2.GroupSpec | pydantic_zarr.v3.GroupSpec
+            )
+            or node.members is None
+        ):
+            return None
+        node = node.members.get(name)
+    return node
+
+
+TGroupModel = TypeVar("TGroupModel", bound=pydantic.BaseModel)
+
+
+def _cached_group_model(
+    owner: pydantic.BaseModel,
+    group: pydantic_zarr.v2.GroupSpec[Any, Any] | pydantic_zarr.v3.GroupSpec[Any, Any],
+    model_cls: type[TGroupModel],
+) -> TGroupModel:
+    """
+    Create a group model from a member group of `owner`, caching the result.
+
+    Validating models can be slow, so they are cached on `owner` alongside the
+    group they were created from, and re-created if that group changes.
+    Like `functools.cached_property`, the cache is stored in the instance
+    `__dict__`, which pydantic ignores when comparing models.
+    """
+    cache_key = f"_cached_{model_cls.__name__}"
+    cached = owner.__dict__.get(cache_key)
+    if cached is None or cached[0] is not group:
+        model = model_cls(attributes=group.attributes, members=group.members)
+        cached = owner.__dict__[cache_key] = (group, model)
+    return cast("TGroupModel", cached[1])
+
+
 TBaseGroupv2 = TypeVar("TBaseGroupv2", bound="BaseGroupv04[Any]")
 TAttrsv2 = TypeVar("TAttrsv2", bound=BaseAttrsv2)
 
@@ -66,15 +285,16 @@ def _from_zarr_v2(
     # on unlistable storage backends, the members of this group will be {}
     group_spec_in: pydantic_zarr.v2.AnyGroupSpec
     group_spec_in = pydantic_zarr.v2.GroupSpec.from_zarr(group, depth=0)
-    attributes = attrs_cls.model_validate(group_spec_in.attributes)
+    attributes = _validate_attrs(attrs_cls, group_spec_in.attributes)
 
     members_tree_flat: dict[
         str, pydantic_zarr.v2.AnyGroupSpec | pydantic_zarr.v2.AnyArraySpec
     ] = {}
 
     # Required array paths
-    for array_path in attrs_cls.get_array_paths(attributes):
-        array_spec = check_array_path(group, array_path, expected_zarr_version=2)
+    array_paths = attrs_cls.get_array_paths(attributes)
+    array_specs = _check_array_paths(group, array_paths, expected_zarr_version=2)
+    for array_path, array_spec in zip(array_paths, array_specs, strict=True):
         members_tree_flat["/" + array_path] = array_spec
 
     # Optional array paths
@@ -88,8 +308,8 @@ def _from_zarr_v2(
     # Required group paths
     required_groups = attrs_cls.get_group_paths(attributes)
     for group_path in required_groups:
-        check_group_path(group, group_path, expected_zarr_version=2)
-        group_flat = required_groups[group_path].from_zarr(group[group_path]).to_flat()  # type: ignore[arg-type]
+        subgroup = _open_group_path(group, group_path, expected_zarr_version=2)
+        group_flat = required_groups[group_path].from_zarr(subgroup).to_flat()
         for path in group_flat:
             members_tree_flat["/" + group_path + path] = group_flat[path]
 
@@ -97,17 +317,15 @@ def _from_zarr_v2(
     optional_groups = attrs_cls.get_optional_group_paths(attributes)
     for group_path in optional_groups:
         try:
-            check_group_path(group, group_path, expected_zarr_version=2)
+            subgroup = _open_group_path(group, group_path, expected_zarr_version=2)
         except FileNotFoundError:
             continue
-        group_flat = optional_groups[group_path].from_zarr(group[group_path]).to_flat()  # type: ignore[arg-type]
+        group_flat = optional_groups[group_path].from_zarr(subgroup).to_flat()
         for path in group_flat:
             members_tree_flat["/" + group_path + path] = group_flat[path]
 
-    members_normalized: pydantic_zarr.v2.AnyGroupSpec = (
-        pydantic_zarr.v2.GroupSpec.from_flat(members_tree_flat)
-    )
-    return group_cls(members=members_normalized.members, attributes=attributes)
+    members = _members_from_flat(members_tree_flat, pydantic_zarr.v2.GroupSpec)
+    return group_cls(members=members, attributes=attributes)
 
 
 TBaseGroupv3 = TypeVar("TBaseGroupv3", bound="BaseGroupv05[Any] | BaseGroupv06[Any]")
@@ -135,21 +353,19 @@ def _from_zarr_v3(
     attrs_cls :
         Attributes class.
     """
-    # on unlistable storage backends, the members of this group will be {}
-    group_spec_in: pydantic_zarr.v3.AnyGroupSpec
-    group_spec_in = pydantic_zarr.v3.GroupSpec.from_zarr(group, depth=0)
     attrs_dict = group.attrs.asdict()
     if "ome" not in attrs_dict:
         raise ValueError("Zarr group attributes does not contain an 'ome' key")
-    ome_attributes = attrs_cls.model_validate(attrs_dict["ome"])
+    ome_attributes = _validate_attrs(attrs_cls, attrs_dict["ome"])
 
     members_tree_flat: dict[
         str, pydantic_zarr.v3.AnyGroupSpec | pydantic_zarr.v3.AnyArraySpec
     ] = {}
 
     # Required array paths
-    for array_path in attrs_cls.get_array_paths(ome_attributes):
-        array_spec = check_array_path(group, array_path, expected_zarr_version=3)
+    array_paths = attrs_cls.get_array_paths(ome_attributes)
+    array_specs = _check_array_paths(group, array_paths, expected_zarr_version=3)
+    for array_path, array_spec in zip(array_paths, array_specs, strict=True):
         members_tree_flat["/" + array_path] = array_spec
 
     # Optional array paths
@@ -163,8 +379,8 @@ def _from_zarr_v3(
     # Required group paths
     required_groups = attrs_cls.get_group_paths(ome_attributes)
     for group_path in required_groups:
-        check_group_path(group, group_path, expected_zarr_version=3)
-        group_flat = required_groups[group_path].from_zarr(group[group_path]).to_flat()  # type: ignore[arg-type]
+        subgroup = _open_group_path(group, group_path, expected_zarr_version=3)
+        group_flat = required_groups[group_path].from_zarr(subgroup).to_flat()
         for path in group_flat:
             members_tree_flat["/" + group_path + path] = group_flat[path]
 
@@ -172,17 +388,19 @@ def _from_zarr_v3(
     optional_groups = attrs_cls.get_optional_group_paths(ome_attributes)
     for group_path in optional_groups:
         try:
-            check_group_path(group, group_path, expected_zarr_version=3)
+            subgroup = _open_group_path(group, group_path, expected_zarr_version=3)
         except FileNotFoundError:
             continue
-        group_flat = optional_groups[group_path].from_zarr(group[group_path]).to_flat()  # type: ignore[arg-type]
+        group_flat = optional_groups[group_path].from_zarr(subgroup).to_flat()
         for path in group_flat:
             members_tree_flat["/" + group_path + path] = group_flat[path]
 
-    members_normalized: pydantic_zarr.v3.AnyGroupSpec
-    members_normalized = pydantic_zarr.v3.GroupSpec.from_flat(members_tree_flat)
+    members = _members_from_flat(members_tree_flat, pydantic_zarr.v3.GroupSpec)
+    # Pass the already validated OME attributes through, so they aren't validated
+    # a second time when creating the group
     return group_cls(  # type: ignore[return-value]
-        members=members_normalized.members, attributes=group_spec_in.attributes
+        members=members,
+        attributes={**attrs_dict, "ome": ome_attributes},
     )
 
 
@@ -76,12 +76,13 @@ class LabelBase(BaseAttrs):
         Check that label_values are consistent across properties and colors
         """
         if self.colors is not None and self.properties is not None:
-            prop_label_value = [prop.label_value for prop in self.properties]
-            color_label_value = [color.label_value for color in self.colors]
-
-            prop_label_value_set = set(prop_label_value)
-            color_label_value_set = set(color_label_value)
-            if color_label_value_set != prop_label_value_set:
+            # Color label values have already been checked to be unique, so they
+            # can't match if there are fewer properties than colors
+            if len(self.properties) < len(self.colors) or {
+                prop.label_value for prop in self.properties
+            } != {color.label_value for color in self.colors}:
+                prop_label_value = [prop.label_value for prop in self.properties]
+                color_label_value = [color.label_value for color in self.colors]
                 msg = (
                     "Inconsistent `label_value` attributes in "
                     "`colors` and `properties`."
@@ -103,8 +104,10 @@ class LabelBase(BaseAttrs):
         if colors is None:
             return None
 
-        dupes = duplicates(x.label_value for x in colors)
-        if len(dupes) > 0:
+        label_values = [x.label_value for x in colors]
+        # Most palettes have no duplicates, so only count them if there are any
+        if len(set(label_values)) != len(label_values):
+            dupes = duplicates(label_values)
             msg = (
                 f"Duplicated label-value: {tuple(dupes.keys())}."
                 "label-values must be unique across elements of `colors`."
@@ -1,6 +1,7 @@
 # Need to import `annotations` for the pydantic_zarr TypeAlias strings to work
 from __future__ import annotations
 
+import warnings
 from typing import TYPE_CHECKING, Literal, TypeVar, overload
 
 import zarr
@@ -16,10 +17,13 @@ from pydantic_zarr.v3 import ArraySpec as ArraySpecv3
 from pydantic_zarr.v3 import GroupSpec as GroupSpecv3
 
 from ome_zarr_models.common.coordinate_transformations import VectorScale
+from ome_zarr_models.exceptions import ValidationWarning
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from pydantic import ValidationInfo
+
 
 __all__ = [
     "AlphaNumericConstraint",
@@ -36,6 +40,23 @@ RGBHexConstraint = StringConstraints(pattern=r"[0-9a-fA-F]{6}")
 
 T = TypeVar("T")
 
+# Validation context key under which fixes made to metadata are recorded
+_FIXES_CONTEXT_KEY = "ome_zarr_models_fixes"
+
+
+def warn_validation_fix(message: str, info: ValidationInfo) -> None:
+    """
+    Report a fix made to metadata while it was being validated.
+
+    If validation was run with a list of fixes in its context (under
+    ``_FIXES_CONTEXT_KEY``), the message is added to that list, and it is up to the
+    caller to report it. Otherwise a `ValidationWarning` is raised.
+    """
+    if isinstance(info.context, dict) and _FIXES_CONTEXT_KEY in info.context:
+        info.context[_FIXES_CONTEXT_KEY].append(message)
+    else:
+        warnings.warn(message, ValidationWarning, stacklevel=3)
+
 
 def unique_items_validator(values: list[T]) -> list[T]:
     """
@@ -89,24 +110,40 @@ def check_array_path(
     ValueError
         If the array doesn't exist, or the array is not the expected Zarr version.
     """
-    try:
-        array = zarr.open_array(
-            store=group.store_path,
-            path=array_path,
-            mode="r",
-            zarr_format=expected_zarr_version,
-        )
-    except FileNotFoundError as e:
-        msg = (
-            f"Expected to find an array at {array_path}, but no array was found there."
-        )
-        raise ValueError(msg) from e
-    except (zarr.errors.ContainsGroupError, zarr.errors.NodeTypeValidationError) as e:
-        msg = (
-            f"Expected to find an array at {array_path}, "
-            "but a group was found there instead."
-        )
-        raise ValueError(msg) from e
+    msg_missing = (
+        f"Expected to find an array at {array_path}, but no array was found there."
+    )
+    msg_group = (
+        f"Expected to find an array at {array_path}, "
+        "but a group was found there instead."
+    )
+    if group.metadata.consolidated_metadata is not None:
+        # The metadata for every node below this group has already been
+        # fetched, so look the array up there instead of going back to the store
+        try:
+            array = group[array_path]
+        except KeyError as e:
+            raise ValueError(msg_missing) from e
+        if isinstance(array, zarr.Group):
+            # Match zarr.open_array, which can't tell a v2 group from a missing array
+            raise ValueError(
+                msg_missing if group.metadata.zarr_format == 2 else msg_group
+            )
+    else:
+        try:
+            array = zarr.open_array(
+                store=group.store_path,
+                path=array_path,
+                mode="r",
+                zarr_format=expected_zarr_version,
+            )
+        except FileNotFoundError as e:
+            raise ValueError(msg_missing) from e
+        except (
+            zarr.errors.ContainsGroupError,
+            zarr.errors.NodeTypeValidationError,
+        ) as e:
+            raise ValueError(msg_group) from e
 
     array_spec: AnyArraySpecv2 | AnyArraySpecv3
     if array.metadata.zarr_format == 2:
@@ -160,36 +197,77 @@ def check_group_path(
     ValueError
         If the group doesn't exist, or the group is not the expected Zarr version.
     """
-    try:
-        group = zarr.open_group(
-            store=group.store_path,
-            path=group_path,
-            mode="r",
-            zarr_format=expected_zarr_version,
-        )
-    except FileNotFoundError as e:
-        msg = f"Expected to find a group at {group_path}, but no group was found there."
-        raise FileNotFoundError(msg) from e
-    except zarr.errors.ContainsArrayError as e:
-        msg = (
-            f"Expected to find an group at {group_path}, "
-            "but an array was found there instead."
-        )
-        raise zarr.errors.ContainsArrayError(msg) from e
-
+    group = _open_group_path(
+        group, group_path, expected_zarr_version=expected_zarr_version
+    )
     group_spec: AnyGroupSpecv2 | AnyGroupSpecv3
     if group.metadata.zarr_format == 2:
-        if expected_zarr_version == 3:
-            raise ValueError("Expected Zarr v3 array, but got v2 array")
         group_spec = GroupSpecv2.from_zarr(group, depth=0)
     else:
-        if expected_zarr_version == 2:
-            raise ValueError("Expected Zarr v2 array, but got v3 array")
         group_spec = GroupSpecv3.from_zarr(group, depth=0)
 
     return group_spec
 
 
+def _open_group_path(
+    group: zarr.Group,
+    group_path: str,
+    *,
+    expected_zarr_version: Literal[2, 3],
+) -> zarr.Group:
+    """
+    Open the group at a given path in a group.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the path doesn't exist.
+    ValueError
+        If the group is not the expected Zarr version.
+    """
+    msg_missing = (
+        f"Expected to find a group at {group_path}, but no group was found there."
+    )
+    msg_array = (
+        f"Expected to find an group at {group_path}, "
+        "but an array was found there instead."
+    )
+    if group.metadata.consolidated_metadata is not None:
+        # The metadata for every node below this group has already been
+        # fetched, so look the group up there instead of going back to the store
+        try:
+            node = group[group_path]
+        except KeyError as e:
+            raise FileNotFoundError(msg_missing) from e
+        if isinstance(node, zarr.Array):
+            # Match zarr.open_group, which can't tell a v2 array from a missing group
+            if group.metadata.zarr_format == 2:
+                raise FileNotFoundError(msg_missing)
+            raise zarr.errors.ContainsArrayError(msg_array)
+        group = node
+    else:
+        try:
+            group = zarr.open_group(
+                store=group.store_path,
+                path=group_path,
+                mode="r",
+                zarr_format=expected_zarr_version,
+            )
+        except FileNotFoundError as e:
+            raise FileNotFoundError(msg_missing) from e
+        except zarr.errors.ContainsArrayError as e:
+            raise zarr.errors.ContainsArrayError(msg_array) from e
+
+    if group.metadata.zarr_format != expected_zarr_version:
+        msg = (
+            f"Expected Zarr v{expected_zarr_version} array, "
+            f"but got v{group.metadata.zarr_format} array"
+        )
+        raise ValueError(msg)
+
+    return group
+
+
 def check_length(
     sequence: Sequence[T], *, valid_lengths: Sequence[int], variable_name: str
 ) -> None:
@@ -52,12 +52,14 @@ class WellMeta(BaseAttrs):
         ValueError
             If an element of `self.well.images` has no `acquisition` attribute.
         """
+        acquisitions = [image.acquisition for image in self.images]
+        if None in acquisitions:
+            raise ValueError(
+                "Cannot get acquisition paths for Zarr files without "
+                "'acquisition' metadata at the well level"
+            )
+
         acquisition_dict: dict[int, list[str]] = defaultdict(list)
-        for image in self.images:
-            if image.acquisition is None:
-                raise ValueError(
-                    "Cannot get acquisition paths for Zarr files without "
-                    "'acquisition' metadata at the well level"
-                )
-            acquisition_dict[image.acquisition].append(image.path)
+        for acquisition, image in zip(acquisitions, self.images, strict=True):
+            acquisition_dict[acquisition].append(image.path)  # type: ignore[index]
         return dict(acquisition_dict)
@@ -4,8 +4,9 @@ import pydantic_zarr.v2
 import zarr
 from pydantic import Field, JsonValue
 
-from ome_zarr_models._utils import check_group_path  # type: ignore[attr-defined]
+from ome_zarr_models._utils import _members_from_flat
 from ome_zarr_models.base import BaseAttrsv2
+from ome_zarr_models.common.validation import _open_group_path
 from ome_zarr_models.v04.base import BaseGroupv04
 from ome_zarr_models.v04.image import Image
 from ome_zarr_models.v04.plate import Plate
@@ -68,19 +69,19 @@ class BioFormats2Raw(BaseGroupv04[BioFormats2RawAttrs]):
         while True:
             image_path = str(image_index)
             try:
-                check_group_path(group, str(image_path), expected_zarr_version=2)
+                image_group = _open_group_path(
+                    group, image_path, expected_zarr_version=2
+                )
             except FileNotFoundError:
                 break
 
-            group_flat = Image.from_zarr(group[image_path]).to_flat()  # type: ignore[arg-type]
+            group_flat = Image.from_zarr(image_group).to_flat()
             for path in group_flat:
                 members_tree_flat["/" + image_path + path] = group_flat[path]
             image_index += 1
 
-        members_normalized: pydantic_zarr.v2.AnyGroupSpec = (
-            pydantic_zarr.v2.GroupSpec.from_flat(members_tree_flat)
-        )
-        return cls(members=members_normalized.members, attributes=attributes)
+        members = _members_from_flat(members_tree_flat, pydantic_zarr.v2.GroupSpec)
+        return cls(members=members, attributes=attributes)
 
     @property
     def image_paths(self) -> list[str]:
@@ -41,18 +41,8 @@ class HCS(BaseGroupv04[HCSAttrs]):
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
         """
-        hcs = _from_zarr_v2(group, cls, HCSAttrs)
-        # Traverse all the Well groups, which themselves contain Image groups
-        hcs_flat = hcs.to_flat()
-        for well in hcs.attributes.plate.wells:
-            if well.path in group:
-                well_group = group[well.path]
-                well_group_flat = Well.from_zarr(well_group).to_flat()  # type: ignore[arg-type]
-                for path in well_group_flat:
-                    hcs_flat["/" + well.path + path] = well_group_flat[path]
-
-        hcs_unflat: AnyGroupSpec = GroupSpec.from_flat(hcs_flat)
-        return cls(attributes=hcs_unflat.attributes, members=hcs_unflat.members)
+        # Wells are optional groups of the plate, so this loads them too
+        return _from_zarr_v2(group, cls, HCSAttrs)
 
     @model_validator(mode="after")
     def _check_valid_acquisitions(self) -> Self:
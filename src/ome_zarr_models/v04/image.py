@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Self
 from pydantic import Field, JsonValue, model_validator
 from pydantic_zarr.v2 import AnyArraySpec, AnyGroupSpec, GroupSpec
 
-from ome_zarr_models._utils import _from_zarr_v2
+from ome_zarr_models._utils import _cached_group_model, _from_zarr_v2, _get_member
 from ome_zarr_models.base import BaseAttrsv2
 from ome_zarr_models.common.coordinate_transformations import _build_transforms
 from ome_zarr_models.v04.axes import Axis
@@ -173,35 +173,33 @@ class Image(BaseGroupv04[ImageAttrs]):
               metadata.
         """
         multimeta = self.attributes.multiscales
-        flat_self = self.to_flat()
 
         for multiscale in multimeta:
             multiscale_ndim = len(multiscale.axes)
             for dataset in multiscale.datasets:
-                try:
-                    maybe_arr: AnyArraySpec | AnyGroupSpec = flat_self[
-                        "/" + dataset.path.lstrip("/")
-                    ]
-                    if isinstance(maybe_arr, GroupSpec):
-                        msg = f"The node at {dataset.path} is a group, not an array."
-                        raise ValueError(msg)
-                    arr_ndim = len(maybe_arr.shape)
-
-                    if arr_ndim != multiscale_ndim:
-                        msg = (
-                            f"The multiscale metadata has {multiscale_ndim} axes "
-                            "which does not match the dimensionality of the array "
-                            f"found in this group at {dataset.path} ({arr_ndim}). "
-                            "The number of axes must match the array dimensionality."
-                        )
-
-                        raise ValueError(msg)
-                except KeyError as e:
+                maybe_arr: AnyArraySpec | AnyGroupSpec | None = _get_member(
+                    self, dataset.path.lstrip("/")
+                )
+                if maybe_arr is None:
                     msg = (
                         f"The multiscale metadata references an array that does not "
                         f"exist in this group: {dataset.path}"
                     )
-                    raise ValueError(msg) from e
+                    raise ValueError(msg)
+
+                if isinstance(maybe_arr, GroupSpec):
+                    msg = f"The node at {dataset.path} is a group, not an array."
+                    raise ValueError(msg)
+
+                arr_ndim = len(maybe_arr.shape)
+                if arr_ndim != multiscale_ndim:
+                    msg = (
+                        f"The multiscale metadata has {multiscale_ndim} axes "
+                        "which does not match the dimensionality of the array "
+                        f"found in this group at {dataset.path} ({arr_ndim}). "
+                        "The number of axes must match the array dimensionality."
+                    )
+                    raise ValueError(msg)
         return self
 
     @property
@@ -223,7 +221,7 @@ class Image(BaseGroupv04[ImageAttrs]):
         if not isinstance(labels_group, GroupSpec):
             raise RuntimeError("Node at 'labels' is not a group")
 
-        return Labels(attributes=labels_group.attributes, members=labels_group.members)
+        return _cached_group_model(self, labels_group, Labels)
 
     @property
     def datasets(self) -> tuple[tuple[Dataset, ...], ...]:
@@ -41,4 +41,7 @@ class ImageLabel(BaseGroupv04[ImageLabelAttrs]):
         """
         # Use Image.from_zarr() to validate multiscale metadata
         image = Image.from_zarr(group)
-        return cls(attributes=image.attributes.model_dump(), members=image.members)
+        # Re-use the validated multiscales instead of dumping and re-validating them
+        attributes = image.attributes.model_dump(exclude={"multiscales"})
+        attributes["multiscales"] = image.attributes.multiscales
+        return cls(attributes=attributes, members=image.members)
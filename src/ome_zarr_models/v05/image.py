@@ -8,7 +8,7 @@ import zarr.errors
 from pydantic import Field, JsonValue, model_validator
 from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, GroupSpec
 
-from ome_zarr_models._utils import _from_zarr_v3
+from ome_zarr_models._utils import _cached_group_model, _from_zarr_v3, _get_member
 from ome_zarr_models.common.coordinate_transformations import _build_transforms
 from ome_zarr_models.v05.axes import Axis
 from ome_zarr_models.v05.base import BaseGroupv05, BaseOMEAttrs, BaseZarrAttrs
@@ -173,22 +173,20 @@ class Image(BaseGroupv05[ImageAttrs]):
               metadata.
         """
         multimeta = self.ome_attributes.multiscales
-        flat_self = self.to_flat()
 
         for multiscale in multimeta:
             multiscale_ndim = len(multiscale.axes)
             multiscale_dim_names = tuple(a.name for a in multiscale.axes)
             for dataset in multiscale.datasets:
-                try:
-                    maybe_arr: AnyArraySpec | AnyGroupSpec = flat_self[
-                        "/" + dataset.path.lstrip("/")
-                    ]
-                except KeyError as e:
+                maybe_arr: AnyArraySpec | AnyGroupSpec | None = _get_member(
+                    self, dataset.path.lstrip("/")
+                )
+                if maybe_arr is None:
                     msg = (
                         f"The multiscale metadata references an array that does not "
                         f"exist in this group: {dataset.path}"
                     )
-                    raise ValueError(msg) from e
+                    raise ValueError(msg)
 
                 if isinstance(maybe_arr, GroupSpec):
                     msg = f"The node at {dataset.path} is a group, not an array."
@@ -274,7 +272,7 @@ class Image(BaseGroupv05[ImageAttrs]):
         if not isinstance(labels_group, GroupSpec):
             raise ValueError("Node at path 'labels' is not a group")
 
-        return Labels(attributes=labels_group.attributes, members=labels_group.members)
+        return _cached_group_model(self, labels_group, Labels)
 
     @property
     def datasets(self) -> tuple[tuple[Dataset, ...], ...]:
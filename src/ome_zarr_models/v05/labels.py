@@ -9,6 +9,7 @@ import zarr.errors
 from pydantic import Field, ValidationError, model_validator
 from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, GroupSpec
 
+from ome_zarr_models._utils import _members_from_flat
 from ome_zarr_models.common.validation import check_array_spec, check_group_spec
 from ome_zarr_models.v05.base import BaseGroupv05, BaseOMEAttrs
 
@@ -132,8 +133,8 @@ class Labels(
             for path in image_model:
                 members_tree_flat["/" + label_path + path] = image_model[path]
 
-        members_normalized: AnyGroupSpec = GroupSpec.from_flat(members_tree_flat)
-        return cls(attributes=attrs_dict, members=members_normalized.members)
+        members = _members_from_flat(members_tree_flat, GroupSpec)
+        return cls(attributes=attrs_dict, members=members)
 
     _check_valid_dtypes = model_validator(mode="after")(_check_valid_dtypes)
 
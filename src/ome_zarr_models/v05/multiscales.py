@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import warnings
 from collections import Counter
 from typing import TYPE_CHECKING, Any, Literal, Self
 
@@ -9,6 +8,7 @@ from pydantic import (
     Field,
     JsonValue,
     SerializerFunctionWrapHandler,
+    ValidationInfo,
     field_validator,
     model_serializer,
     model_validator,
@@ -28,8 +28,8 @@ from ome_zarr_models.common.validation import (
     check_length,
     check_ordered_scales,
     unique_items_validator,
+    warn_validation_fix,
 )
-from ome_zarr_models.exceptions import ValidationWarning
 from ome_zarr_models.v05.axes import Axes
 
 if TYPE_CHECKING:
@@ -260,7 +260,7 @@ class Dataset(BaseAttrs):
 
     @field_validator("coordinateTransformations", mode="before")
     def _ensure_scale_translation(
-        transforms_obj: object,
+        transforms_obj: object, info: ValidationInfo
     ) -> object:
         """
         Ensures that
@@ -289,11 +289,10 @@ class Dataset(BaseAttrs):
                 transforms[1], VectorScale
             ):
                 # Can only do the swap if we know the vectors
-                warnings.warn(
+                warn_validation_fix(
                     "Translation and scale are in the wrong order "
                     "(scale should come first). Swapping transforms.",
-                    ValidationWarning,
-                    stacklevel=2,
+                    info,
                 )
                 new_transforms = (
                     transforms[1],
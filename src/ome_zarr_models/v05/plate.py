@@ -2,10 +2,9 @@
 For reference, see the [plate section of the OME-Zarr specification](https://ngff.openmicroscopy.org/0.5/index.html#plate-md).
 """
 
-import warnings
 from typing import Self
 
-from pydantic import Field, model_validator
+from pydantic import Field, ValidationInfo, model_validator
 
 from ome_zarr_models.common.plate import (
     Acquisition,
@@ -14,7 +13,7 @@ from ome_zarr_models.common.plate import (
     Row,
     WellInPlate,
 )
-from ome_zarr_models.exceptions import ValidationWarning
+from ome_zarr_models.common.validation import warn_validation_fix
 
 __all__ = [
     "Acquisition",
@@ -36,12 +35,11 @@ class Plate(PlateBase):
     )
 
     @model_validator(mode="after")
-    def check_version_given(self) -> Self:
+    def check_version_given(self, info: ValidationInfo) -> Self:
         if "version" not in self.model_fields_set:
-            warnings.warn(
+            warn_validation_fix(
                 "'version' field not specified in plate metadata, "
                 "setting version='0.5'",
-                ValidationWarning,
-                stacklevel=2,
+                info,
             )
         return self
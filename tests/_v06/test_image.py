@@ -12,9 +12,10 @@ from ome_zarr_models._v06.coordinate_transforms import (
     Translation,
 )
 from ome_zarr_models._v06.image import Image, ImageAttrs
+from ome_zarr_models._v06.labels import LabelsAttrs
 from ome_zarr_models._v06.multiscales import Dataset, Multiscale
 
-from .conftest import json_to_zarr_group
+from .conftest import json_to_dict, json_to_zarr_group
 
 
 def test_image(store: Store) -> None:
@@ -353,6 +354,41 @@ def test_image_new() -> None:
     )
 
 
+def test_image_with_labels(store: Store) -> None:
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    labels_group = zarr_group.create_group(
+        "labels",
+        attributes=json_to_dict(json_fname="labels_example.json"),
+    )
+    image_label_group = labels_group.create_group(
+        "cell_space_segmentation",
+        attributes=json_to_dict(json_fname="image_label_example.json"),
+    )
+    for group in (zarr_group, image_label_group):
+        for path in ("0", "1", "2"):
+            group.create_array(
+                path,
+                shape=(1, 1, 1, 1, 1),
+                dtype="uint8",
+                dimension_names=["t", "c", "z", "y", "x"],
+            )
+
+    image = Image.from_zarr(zarr_group)
+    assert image.labels is not None
+    assert image.labels.attributes.ome == LabelsAttrs(
+        version="0.6", labels=["cell_space_segmentation"]
+    )
+    # Labels are cached, without affecting comparisons
+    assert image.labels is image.labels
+    assert image == Image.from_zarr(zarr_group)
+    # ...and re-created if the labels group changes
+    assert image.members is not None
+    new_members = {**image.members, "labels": image.members["labels"].model_copy()}
+    new_image = image.model_copy(update={"members": new_members})
+    assert new_image.labels is not image.labels
+    assert new_image.labels == image.labels
+
+
 def test_transform_graph() -> None:
     zarr_group = json_to_zarr_group(
         json_fname="image_example.json", store=MemoryStore()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Never, TypeVar
 
@@ -36,20 +37,31 @@ def get_examples_path(*, version: Version) -> Path:
         raise ValueError(f"Unknown value for {version=}")
 
 
+@cache
+def _read_example_json(*, version: Version, json_fname: str) -> str:
+    """
+    Read the contents of an example JSON file.
+
+    Example files are read by many tests, so are only read from disk once. The
+    contents are cached as a string, so each test parses its own copy.
+    """
+    return (get_examples_path(version=version) / json_fname).read_text()
+
+
 def json_to_dict(*, version: Version, json_fname: str) -> Any:
     """
     Load an example JSON file and return as a dictionary.
     """
-    with open(get_examples_path(version=version) / json_fname) as f:
-        return json.load(f)
+    return json.loads(_read_example_json(version=version, json_fname=json_fname))
 
 
 def read_in_json(*, version: Version, json_fname: str, model_cls: type[T]) -> T:
     """
     Load an example JSON file into a ome-zarr-models base attributes class.
     """
-    with open(get_examples_path(version=version) / json_fname) as f:
-        return model_cls.model_validate_json(f.read())
+    return model_cls.model_validate_json(
+        _read_example_json(version=version, json_fname=json_fname)
+    )
 
 
 def json_to_zarr_group(
@@ -66,8 +78,7 @@ def json_to_zarr_group(
     else:
         raise ValueError(f"Unknown value for {version=}")
     group = zarr.open_group(store=store, zarr_format=zarr_format)
-    with open(get_examples_path(version=version) / json_fname) as f:
-        attrs = json.load(f)
+    attrs = json_to_dict(version=version, json_fname=json_fname)
 
     group.attrs.put(attrs)
     return group
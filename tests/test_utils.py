@@ -0,0 +1,89 @@
+import json
+import re
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import pydantic_zarr.v2
+import pydantic_zarr.v3
+import pytest
+
+from ome_zarr_models._utils import _members_from_flat, _validate_attrs_json
+from ome_zarr_models.v05.plate import Plate
+
+
+@pytest.mark.parametrize("module", [pydantic_zarr.v2, pydantic_zarr.v3])
+def test_members_from_flat(module: Any) -> None:
+    array = module.ArraySpec.from_array(np.zeros((1, 1)))
+    members_flat = {
+        "/0": array,
+        "/labels": module.GroupSpec(attributes={"a": 1}, members=None),
+        "/1": array,
+        "/labels/seg": module.GroupSpec(attributes={"b": 2}, members=None),
+        "/labels/seg/0": array,
+        "/implicit/0": array,
+    }
+    members = _members_from_flat(members_flat, module.GroupSpec)
+    expected = module.GroupSpec.from_flat(members_flat).members
+    assert members == expected
+    # Groups come before arrays, at every level of the hierarchy
+    assert list(members) == list(expected) == ["labels", "implicit", "0", "1"]
+    assert list(members["labels"].members) == list(expected["labels"].members)
+
+
+@pytest.mark.parametrize("module", [pydantic_zarr.v2, pydantic_zarr.v3])
+def test_members_from_flat_invalid_node(module: Any) -> None:
+    with pytest.raises(
+        ValueError,
+        match=re.escape("Value at '/0' is not an ArraySpec or GroupSpec"),
+    ):
+        _members_from_flat({"/0": "not a node"}, module.GroupSpec)
+
+
+def test_validate_attrs_no_warnings_leak_between_threads() -> None:
+    """
+    Fixes recorded for cached attributes only come from validating them.
+    """
+    stop = threading.Event()
+
+    def warn_unrelated() -> None:
+        while not stop.is_set():
+            try:
+                warnings.warn("Unrelated warning", UserWarning, stacklevel=1)
+            except UserWarning:
+                # The test suite turns warnings into errors
+                pass
+
+    # Unique names, so each validation is a cache miss
+    plates = [
+        {
+            "name": f"plate{idx}",
+            "columns": [{"name": "1"}],
+            "rows": [{"name": "A"}],
+            "wells": [{"path": "A/1", "rowIndex": 0, "columnIndex": 0}],
+            **({"version": "0.5"} if idx % 2 else {}),
+        }
+        for idx in range(200)
+    ]
+    noise = threading.Thread(target=warn_unrelated)
+    noise.start()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda plate: _validate_attrs_json(Plate, json.dumps(plate)),
+                    plates,
+                )
+            )
+    finally:
+        stop.set()
+        noise.join()
+
+    version_fix = (
+        "'version' field not specified in plate metadata, setting version='0.5'"
+    )
+    assert [fixes for _, fixes in results] == [
+        () if idx % 2 else (version_fix,) for idx in range(200)
+    ]
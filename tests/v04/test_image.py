@@ -2,8 +2,10 @@ import re
 
 import numpy as np
 import pytest
-from pydantic_zarr.v2 import ArraySpec
+import zarr
+from pydantic_zarr.v2 import ArraySpec, GroupSpec
 from zarr.abc.store import Store
+from zarr.storage import MemoryStore
 
 from ome_zarr_models.common.coordinate_transformations import VectorTranslation
 from ome_zarr_models.v04.axes import Axis
@@ -253,3 +255,107 @@ def test_no_global_transform() -> None:
     assert "coordinateTransformations" not in model_dict["attributes"]["multiscales"][0]
 
     new_image.model_dump(exclude_none=True)
+
+
+def test_image_consolidated(example_image: Image) -> None:
+    """
+    Test reading an image from a group with consolidated metadata.
+    """
+    store = MemoryStore()
+    example_image.to_zarr(store, path="image")
+    image = Image.from_zarr(zarr.open_group(store, path="image", mode="r"))
+    zarr.consolidate_metadata(store, path="image", zarr_format=2)
+
+    group = zarr.open_group(store, path="image", mode="r", use_consolidated=True)
+    assert group.metadata.consolidated_metadata is not None
+    assert Image.from_zarr(group) == image
+
+
+def test_image_consolidated_missing_array(example_image: Image) -> None:
+    """
+    Test that a missing array is still caught when using consolidated metadata.
+    """
+    store = MemoryStore()
+    model_dict = example_image.model_dump(exclude={"members": {"scale0": True}})
+    GroupSpec(**model_dict).to_zarr(store, path="image")
+    zarr.consolidate_metadata(store, path="image", zarr_format=2)
+
+    group = zarr.open_group(store, path="image", mode="r", use_consolidated=True)
+    with pytest.raises(
+        ValueError,
+        match="Expected to find an array at scale0, but no array was found there",
+    ):
+        Image.from_zarr(group)
+
+
+@pytest.mark.parametrize("use_consolidated", [False, True])
+def test_image_array_at_labels(example_image: Image, use_consolidated: bool) -> None:
+    """
+    Test that an array at the optional "labels" path is ignored, with or without
+    consolidated metadata.
+    """
+    store = MemoryStore()
+    example_image.to_zarr(store, path="image")
+    zarr.open_group(store, path="image", mode="r+").create_array(
+        "labels", shape=(1,), dtype="uint8"
+    )
+    if use_consolidated:
+        zarr.consolidate_metadata(store, path="image", zarr_format=2)
+
+    group = zarr.open_group(
+        store, path="image", mode="r", use_consolidated=use_consolidated
+    )
+    image = Image.from_zarr(group)
+    assert image.members is not None
+    assert "labels" not in image.members
+    assert image.labels is None
+
+
+@pytest.mark.parametrize("use_consolidated", [False, True])
+def test_image_group_at_array_path(
+    example_image: Image, use_consolidated: bool
+) -> None:
+    """
+    Test that a group where an array is expected is reported the same way, with or
+    without consolidated metadata.
+    """
+    store = MemoryStore()
+    model_dict = example_image.model_dump(exclude={"members": {"scale0": True}})
+    GroupSpec(**model_dict).to_zarr(store, path="image")
+    zarr.open_group(store, path="image", mode="r+").create_group("scale0")
+    if use_consolidated:
+        zarr.consolidate_metadata(store, path="image", zarr_format=2)
+
+    group = zarr.open_group(
+        store, path="image", mode="r", use_consolidated=use_consolidated
+    )
+    with pytest.raises(
+        ValueError,
+        match="Expected to find an array at scale0, but no array was found there",
+    ):
+        Image.from_zarr(group)
+
+
+def test_new_image_leading_slashes() -> None:
+    """
+    Dataset paths with leading slashes resolve to arrays in the group.
+    """
+    new_image = Image.new(
+        array_specs=[
+            ArraySpec(shape=(5, 5), chunks=(2, 2), dtype=np.uint8, attributes={}),
+            ArraySpec(shape=(3, 3), chunks=(2, 2), dtype=np.uint8, attributes={}),
+        ],
+        paths=["/scale0", "//scale1"],
+        axes=[
+            Axis(name="x", type="space", unit="km"),
+            Axis(name="y", type="space", unit="km"),
+        ],
+        scales=[(4, 4), (8, 8)],
+        translations=[(2, 2), (4, 4)],
+    )
+    assert new_image.members is not None
+    assert list(new_image.members) == ["scale0", "scale1"]
+    assert [d.path for d in new_image.attributes.multiscales[0].datasets] == [
+        "/scale0",
+        "//scale1",
+    ]
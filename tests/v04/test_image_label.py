@@ -115,3 +115,31 @@ def test_default_source() -> None:
     )
     assert attrs.source is not None
     assert attrs.source.image == "../../"
+
+
+def test_duplicate_colors() -> None:
+    """
+    > All the values under the label-value (of colors) key MUST be unique.
+    """
+    label_values = [0, 1, 1]
+    with pytest.raises(ValidationError, match=r"Duplicated label-value: \(1,\)"):
+        Label(
+            colors=tuple(
+                Color(label_value=value, rgba=(255, 255, 255, 255))
+                for value in label_values
+            ),
+            version="0.4",
+        )
+
+
+@pytest.mark.parametrize("property_values", [[1], [1, 3], [1, 2, 3]])
+def test_inconsistent_label_values(property_values: list[int]) -> None:
+    with pytest.raises(ValidationError, match="Inconsistent `label_value` attributes"):
+        Label(
+            colors=(
+                Color(label_value=1, rgba=(255, 255, 255, 255)),
+                Color(label_value=2, rgba=(0, 255, 255, 128)),
+            ),
+            properties=tuple(Property(label_value=value) for value in property_values),
+            version="0.4",
+        )
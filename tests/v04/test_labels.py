@@ -18,3 +18,15 @@ def test_image_with_labels(store: Store) -> None:
     labels_group = ome_group.labels
     assert labels_group is not None
     assert labels_group.attributes == LabelsAttrs(labels=["labels0"])
+    # Labels are cached, without affecting comparisons
+    assert ome_group.labels is labels_group
+    assert ome_group == Image.from_zarr(zarr_group)
+    # ...and re-created if the labels group changes
+    assert ome_group.members is not None
+    new_members = {
+        **ome_group.members,
+        "labels": ome_group.members["labels"].model_copy(),
+    }
+    new_image = ome_group.model_copy(update={"members": new_members})
+    assert new_image.labels is not labels_group
+    assert new_image.labels == labels_group
@@ -27,12 +27,43 @@ if TYPE_CHECKING:
     from zarr.abc.store import Store
 
 DEFAULT_UNITS_MAP = {"space": "meter", "time": "second"}
+# Space axes named "0", "1", ..., shared between tests that need N axes
+NUMERIC_SPACE_AXES = tuple(
+    Axis(name=str(idx), type="space", unit="meter") for idx in range(8)
+)
+# Expected error messages, matched literally
+UNIQUE_AXES_MSG = re.compile(re.escape("Axis names must be unique."))
+SPACE_AXES_LAST_MSG = re.compile(
+    re.escape("All space axes must be at the end of the axes list.")
+)
+INCONSISTENT_TRANSFORMS_MSG = re.compile(
+    re.escape("The transforms have inconsistent dimensionality.")
+)
+
+
+def _scaffold_dataset(rank: int, path: str = "path") -> Dataset:
+    """
+    Return a valid Dataset, without validating it.
+
+    For use in tests where the dataset is needed, but isn't what is being tested.
+    """
+    return Dataset.model_construct(
+        path=path,
+        coordinateTransformations=(
+            VectorScale.model_construct(type="scale", scale=[1.0] * rank),
+            VectorTranslation.model_construct(
+                type="translation", translation=[0.0] * rank
+            ),
+        ),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_multiscale() -> Multiscale:
     """
     Return a valid Multiscale object.
+
+    Multiscale models are immutable, so this is shared between tests.
     """
     axes = (
         Axis(name="c", type="channel", unit=None),
@@ -45,8 +76,10 @@ def default_multiscale() -> Multiscale:
     transforms_dset = _build_transforms(scale=(1,) * rank, translation=(0,) * rank)
     num_datasets = 3
     datasets = tuple(
-        Dataset(path=f"path{idx}", coordinateTransformations=transforms_dset)
-        for idx in range(num_datasets)
+        [
+            Dataset(path=f"path{idx}", coordinateTransformations=transforms_dset)
+            for idx in range(num_datasets)
+        ]
     )
 
     multi = Multiscale(
@@ -72,9 +105,9 @@ def test_multiscale_unique_axis_names() -> None:
         Axis(name="x", type="space", unit="meter"),
     )
     rank = len(axes)
-    datasets = (Dataset.build(path="path", scale=(1,) * rank, translation=(0,) * rank),)
+    datasets = (_scaffold_dataset(rank),)
 
-    with pytest.raises(ValidationError, match="Axis names must be unique."):
+    with pytest.raises(ValidationError, match=UNIQUE_AXES_MSG):
         Multiscale(
             axes=axes,
             datasets=datasets,
@@ -98,15 +131,15 @@ def test_multiscale_space_axes_last(axis_types: list[str]) -> None:
     """
     units_map = {"space": "meter", "time": "second"}
     axes = tuple(
-        Axis(name=str(idx), type=t, unit=units_map.get(t))
-        for idx, t in enumerate(axis_types)
+        [
+            Axis(name=str(idx), type=t, unit=units_map.get(t))
+            for idx, t in enumerate(axis_types)
+        ]
     )
     rank = len(axes)
-    datasets = (Dataset.build(path="path", scale=(1,) * rank, translation=(0,) * rank),)
+    datasets = (_scaffold_dataset(rank),)
     # TODO: make some axis-specific exceptions
-    with pytest.raises(
-        ValidationError, match="All space axes must be at the end of the axes list."
-    ):
+    with pytest.raises(ValidationError, match=SPACE_AXES_LAST_MSG):
         Multiscale(
             axes=axes,
             datasets=datasets,
@@ -131,11 +164,13 @@ def test_axes_order(axis_types: list[str]) -> None:
     > custom axis (if present) and the axes of type "space".
     """
     axes = tuple(
-        Axis(name=str(idx), type=t, unit=DEFAULT_UNITS_MAP.get(t))
-        for idx, t in enumerate(axis_types)
+        [
+            Axis(name=str(idx), type=t, unit=DEFAULT_UNITS_MAP.get(t))
+            for idx, t in enumerate(axis_types)
+        ]
     )
     rank = len(axes)
-    datasets = (Dataset.build(path="path", scale=(1,) * rank, translation=(0,) * rank),)
+    datasets = (_scaffold_dataset(rank),)
     with pytest.raises(
         ValidationError, match="Time axis must be at the beginning of axis list"
     ):
@@ -154,10 +189,8 @@ def test_multiscale_axis_length(num_axes: int) -> None:
     > The length of "axes" must be between 2 and 5...
     """
     rank = num_axes
-    axes = tuple(
-        Axis(name=str(idx), type="space", unit="meter") for idx in range(num_axes)
-    )
-    datasets = (Dataset.build(path="path", scale=(1,) * rank, translation=(0,) * rank),)
+    axes = NUMERIC_SPACE_AXES[:num_axes]
+    datasets = (_scaffold_dataset(rank),)
     with pytest.raises(ValidationError, match=r"Length of axes \([0-9]+\) not valid"):
         Multiscale(
             axes=axes,
@@ -176,7 +209,7 @@ def test_invalid_dataset_dimensions() -> None:
         Dataset.build(path="path", scale=(1,) * rank, translation=(0,) * rank)
         for rank in [2, 3]
     ]
-    axes = tuple(Axis(name=str(idx), type="space", unit="meter") for idx in range(3))
+    axes = NUMERIC_SPACE_AXES[:3]
     with pytest.raises(
         ValidationError,
         match=(
@@ -199,10 +232,7 @@ def test_transform_invalid_ndims(
     """
     Make sure dimensions of scale/translation transforms match.
     """
-    with pytest.raises(
-        ValidationError,
-        match="The transforms have inconsistent dimensionality.",
-    ):
+    with pytest.raises(ValidationError, match=INCONSISTENT_TRANSFORMS_MSG):
         Dataset.build(path="foo", scale=scale, translation=translation)
 
 
@@ -311,16 +341,12 @@ def test_validate_axes_top_transforms() -> None:
     )
     with pytest.raises(
         ValidationError,
-        match=msg_expect,
+        match=re.escape(msg_expect),
     ):
         Multiscale(
             name="foo",
             axes=[Axis(name=str(idx), type="space") for idx in range(axes_rank)],
-            datasets=(
-                Dataset.build(
-                    path="foo", scale=(1,) * axes_rank, translation=(0,) * axes_rank
-                ),
-            ),
+            datasets=(_scaffold_dataset(axes_rank, path="foo"),),
             coordinateTransformations=_build_transforms(
                 scale=(1,) * tforms_rank, translation=None
             ),
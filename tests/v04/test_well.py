@@ -1,3 +1,4 @@
+import pytest
 from zarr.abc.store import Store
 
 from ome_zarr_models.v04.well import Well, WellAttrs
@@ -8,13 +9,14 @@ from tests.v04.conftest import json_to_zarr_group
 def test_well(store: Store) -> None:
     zarr_group = json_to_zarr_group(json_fname="well_example_1.json", store=store)
     ome_group = Well.from_zarr(zarr_group)
-    assert ome_group.attributes == WellAttrs(
-        well=WellMeta(
+    # Expected models are trusted, so are created without validation
+    assert ome_group.attributes == WellAttrs.model_construct(
+        well=WellMeta.model_construct(
             images=[
-                WellImage(path="0", acquisition=1),
-                WellImage(path="1", acquisition=1),
-                WellImage(path="2", acquisition=2),
-                WellImage(path="3", acquisition=2),
+                WellImage.model_construct(path="0", acquisition=1),
+                WellImage.model_construct(path="1", acquisition=1),
+                WellImage.model_construct(path="2", acquisition=2),
+                WellImage.model_construct(path="3", acquisition=2),
             ],
             version="0.4",
         )
@@ -22,11 +24,11 @@ def test_well(store: Store) -> None:
 
     zarr_group = json_to_zarr_group(json_fname="well_example_2.json", store=store)
     ome_group = Well.from_zarr(zarr_group)
-    assert ome_group.attributes == WellAttrs(
-        well=WellMeta(
+    assert ome_group.attributes == WellAttrs.model_construct(
+        well=WellMeta.model_construct(
             images=[
-                WellImage(path="0", acquisition=0),
-                WellImage(path="1", acquisition=3),
+                WellImage.model_construct(path="0", acquisition=0),
+                WellImage.model_construct(path="1", acquisition=3),
             ],
             version="0.4",
         )
@@ -45,3 +47,18 @@ def test_get_paths() -> None:
     )
 
     assert well.get_acquisition_paths() == {1: ["0", "1"], 2: ["2", "3"]}
+
+
+def test_get_paths_no_acquisition() -> None:
+    well = WellMeta(
+        images=[
+            WellImage(path="0", acquisition=1),
+            WellImage(path="1", acquisition=None),
+        ],
+        version="0.4",
+    )
+
+    with pytest.raises(
+        ValueError, match="Cannot get acquisition paths for Zarr files without"
+    ):
+        well.get_acquisition_paths()
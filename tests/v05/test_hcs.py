@@ -1,11 +1,14 @@
 from typing import TYPE_CHECKING
 
+import pytest
 import zarr
 from zarr.abc.store import Store
+from zarr.storage import MemoryStore
 
+from ome_zarr_models.exceptions import ValidationWarning
 from ome_zarr_models.v05.hcs import HCS, HCSAttrs
 from ome_zarr_models.v05.plate import Acquisition, Column, Plate, Row, WellInPlate
-from tests.v05.conftest import json_to_zarr_group
+from tests.v05.conftest import json_to_dict, json_to_zarr_group
 
 if TYPE_CHECKING:
     from pydantic import JsonValue
@@ -96,3 +99,25 @@ def test_non_existent_wells_from_zarr() -> None:
         attributes={"ome": {"plate": plate, "version": "0.5"}},
     )
     HCS.from_zarr(group)
+
+
+def test_hcs_repeated_fix_warnings() -> None:
+    """
+    Test that metadata fixes are reported every time the same group is read,
+    even though the validated metadata is cached.
+    """
+    attrs = json_to_dict(json_fname="hcs_example.json")
+    del attrs["ome"]["plate"]["version"]
+    zarr_group = zarr.open_group(MemoryStore(), zarr_format=3)
+    zarr_group.attrs.put(attrs)
+
+    hcs_groups = []
+    for _ in range(2):
+        with pytest.warns(
+            ValidationWarning, match="'version' field not specified in plate metadata"
+        ):
+            hcs_groups.append(HCS.from_zarr(zarr_group))
+
+    assert hcs_groups[0] == hcs_groups[1]
+    plates = [hcs.ome_attributes.plate for hcs in hcs_groups]
+    assert plates[0].wells is not plates[1].wells
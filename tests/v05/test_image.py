@@ -4,6 +4,7 @@ import pytest
 import zarr
 from pydantic import ValidationError
 from zarr.abc.store import Store
+from zarr.storage import MemoryStore
 
 from ome_zarr_models.v05.axes import Axis
 from ome_zarr_models.v05.coordinate_transformations import VectorScale
@@ -203,6 +204,15 @@ def test_image_with_labels(store: Store) -> None:
     assert image.labels.attributes.ome == LabelsAttrs(
         version="0.5", labels=["cell_space_segmentation"]
     )
+    # Labels are cached, without affecting comparisons
+    assert image.labels is image.labels
+    assert image == Image.from_zarr(zarr_group)
+    # ...and re-created if the labels group changes
+    assert image.members is not None
+    new_members = {**image.members, "labels": image.members["labels"].model_copy()}
+    new_image = image.model_copy(update={"members": new_members})
+    assert new_image.labels is not image.labels
+    assert new_image.labels == image.labels
 
 
 def test_image_with_labels_mismatch_multiscales(store: Store) -> None:
@@ -249,3 +259,66 @@ def test_image_with_labels_mismatch_multiscales(store: Store) -> None:
         ),
     ):
         Image.from_zarr(zarr_group)
+
+
+# Consolidated metadata isn't part of the Zarr v3 specification yet
+consolidated_v3 = pytest.mark.filterwarnings(
+    "ignore:Consolidated metadata is currently not part:UserWarning"
+)
+
+
+@consolidated_v3
+def test_image_consolidated() -> None:
+    """
+    Test reading an image from a group with consolidated metadata.
+    """
+    store = MemoryStore()
+    make_valid_image_group(store)
+    image = Image.from_zarr(zarr.open_group(store, mode="r"))
+    zarr.consolidate_metadata(store)
+
+    group = zarr.open_group(store, mode="r", use_consolidated=True)
+    assert group.metadata.consolidated_metadata is not None
+    assert Image.from_zarr(group) == image
+
+
+@consolidated_v3
+@pytest.mark.parametrize("use_consolidated", [False, True])
+def test_image_group_at_array_path(use_consolidated: bool) -> None:
+    """
+    Test that a group where an array is expected is reported the same way, with or
+    without consolidated metadata.
+    """
+    store = MemoryStore()
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    zarr_group.create_group("0")
+    if use_consolidated:
+        zarr.consolidate_metadata(store)
+
+    group = zarr.open_group(store, mode="r", use_consolidated=use_consolidated)
+    with pytest.raises(
+        ValueError,
+        match="Expected to find an array at 0, but a group was found there instead",
+    ):
+        Image.from_zarr(group)
+
+
+@consolidated_v3
+@pytest.mark.parametrize("use_consolidated", [False, True])
+def test_image_array_at_labels(use_consolidated: bool) -> None:
+    """
+    Test that an array where the labels group should be is reported the same way,
+    with or without consolidated metadata.
+    """
+    store = MemoryStore()
+    zarr_group = make_valid_image_group(store)
+    zarr_group.create_array("labels", shape=(1,), dtype="uint8")
+    if use_consolidated:
+        zarr.consolidate_metadata(store)
+
+    group = zarr.open_group(store, mode="r", use_consolidated=use_consolidated)
+    with pytest.raises(
+        zarr.errors.ContainsArrayError,
+        match="Expected to find an group at labels, but an array was found there",
+    ):
+        Image.from_zarr(group)